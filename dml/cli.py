@@ -7,7 +7,7 @@ from pathlib import Path
 
 import click
 
-from dml.events import Event, EventStore, EventType
+from dml.events import Event, EventStore, EventType, reset_database
 from dml.memory_api import MemoryAPI
 from dml.replay import ReplayEngine
 
@@ -62,46 +62,18 @@ def init(ctx: click.Context) -> None:
 @click.pass_context
 def reset(ctx: click.Context, force: bool, y: bool) -> None:
     """Clear all memory (reset database for fresh demo)."""
-    import sqlite3
-
     db_path = Path(ctx.obj["db_path"])
 
     if not db_path.exists():
-        # Create fresh database
-        store = EventStore(str(db_path))
-        store.close()
+        reset_database(db_path)
         click.echo(f"Created fresh memory store at {db_path}")
         return
 
     if not (force or y):
         click.confirm(f"This will delete all events in {db_path}. Continue?", abort=True)
 
-    # First, checkpoint WAL to flush any pending writes and close connections
-    try:
-        conn = sqlite3.connect(str(db_path))
-        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-        conn.close()
-    except sqlite3.Error as e:
-        click.echo(f"Warning: WAL checkpoint failed: {e}", err=True)
-
-    # Small delay for any lingering connections to release
-    time.sleep(0.1)
-
-    # Delete main db and any WAL/journal files
-    for suffix in ["", "-wal", "-shm", "-journal"]:
-        p = Path(str(db_path) + suffix)
-        if p.exists():
-            try:
-                p.unlink()
-            except OSError as e:
-                click.echo(f"Warning: Could not delete {p}: {e}", err=True)
-
-    # Small delay to ensure filesystem catches up
-    time.sleep(0.1)
-
-    # Create fresh database
-    store = EventStore(str(db_path))
-    store.close()
+    for warning in reset_database(db_path):
+        click.echo(f"Warning: {warning}", err=True)
     click.echo(f"Memory reset. Fresh database at {db_path}")
 
 
@@ -842,6 +814,8 @@ def live_tui(ctx: click.Context, script: str | None, auto: bool, debug: bool) ->
     import subprocess
     from dml.demo.tui import DemoApp
 
+    DemoApp.install_uvloop()
+
     # Check if we're already recording (avoid infinite loop)
     if os.environ.get("DML_RECORDING"):
         db_path = ctx.obj.get("db_path") if ctx.obj else None
@@ -1,5 +1,13 @@
 """DML Demo package - TUI demos for showcasing DML functionality."""
 
-from .tui import DemoApp, main
-
 __all__ = ["DemoApp", "main"]
+
+
+def __getattr__(name: str):
+    # Import the Textual app only when it is used, so the other demo
+    # modules (chat_demo, validator, scripts) load without it
+    if name in __all__:
+        from . import tui
+
+        return getattr(tui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+"""Demo script loading (prompts.yaml), kept free of TUI imports."""
+
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+try:
+    # libyaml's C loader (bundled with PyYAML wheels); same results as SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed prompts.yaml, reused while the YAML file's path/mtime/size are unchanged
+_PROMPTS_CACHE = Path.home() / ".dml" / "prompts.cache.json"
+
+# (cache key, scripts) from the last load in this process
+_scripts_memo: tuple[list, dict] | None = None
+
+
+def load_all_scripts() -> dict:
+    """Load all demo scripts from YAML file (through a JSON cache).
+
+    Repeat calls in one process return the same dict until prompts.yaml
+    changes, so callers must treat it as read-only.
+    """
+    global _scripts_memo
+    prompts_file = Path(__file__).parent / "prompts.yaml"
+    try:
+        st = prompts_file.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Demo prompts file not found: {prompts_file}") from None
+    cache_key = [str(prompts_file), st.st_mtime_ns, st.st_size]
+    if _scripts_memo is not None and _scripts_memo[0] == cache_key:
+        return _scripts_memo[1]
+    data = _read_all_scripts(prompts_file, cache_key)
+    _scripts_memo = (cache_key, data)
+    return data
+
+
+def _read_all_scripts(prompts_file: Path, cache_key: list) -> dict:
+    """Read prompts.yaml from the JSON cache if it matches cache_key, else parse it."""
+    try:
+        cached = json.loads(_PROMPTS_CACHE.read_text())
+        if cached["key"] == cache_key:
+            return cached["scripts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # Bytes in: libyaml decodes the UTF-8 itself, independent of the locale
+    with open(prompts_file, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Only cache data that survives a JSON round trip unchanged
+    try:
+        encoded = json.dumps({"key": cache_key, "scripts": data})
+        if json.loads(encoded)["scripts"] == data:
+            _PROMPTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees a partial file
+            tmp = _PROMPTS_CACHE.with_name(f"{_PROMPTS_CACHE.name}.{os.getpid()}.tmp")
+            try:
+                tmp.write_text(encoded)
+                os.replace(tmp, _PROMPTS_CACHE)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+def load_demo_prompts(name: str) -> dict:
+    """Load a specific demo script from YAML file."""
+    data = load_all_scripts()
+    if name not in data:
+        available = list(data.keys())
+        raise KeyError(f"Demo script '{name}' not found. Available: {available}")
+    return data[name]
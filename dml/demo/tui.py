@@ -1,36 +1,56 @@
 """Demo TUI using Textual for proper scrolling and interactivity."""
 
 import os
-import subprocess
+import shutil
 import asyncio
+import codecs
+import contextlib
+import functools
+import tempfile
+import threading
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from itertools import islice
+from operator import attrgetter
 
 
 # Load .env file if it exists (for WANDB_API_KEY, etc.)
+_DOTENV_LOADED = False
+
+
 def _load_dotenv():
     """Simple .env loader without external dependency."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
     env_path = Path(__file__).parent.parent.parent / ".env"
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, value = line.partition("=")
-                    os.environ.setdefault(key.strip(), value.strip())
-
-import yaml
+    try:
+        data = env_path.read_text()
+    except FileNotFoundError:
+        return
+    for line in data.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "=" in line:
+            key, _, value = line.partition("=")
+            os.environ.setdefault(key.strip(), value.strip())
+
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widgets import Static, Header, Footer, Markdown, Label, Rule, LoadingIndicator
 from textual.reactive import reactive
 from textual import work
+from textual.worker import Worker, get_current_worker
 from rich.markup import escape as rich_escape
 
-from dml.events import EventStore
-from dml.replay import ReplayEngine
+from dml.demo.scripts import load_all_scripts, load_demo_prompts
+from dml.events import EventStore, EventType, reset_database
+from dml.projections import ProjectionEngine, ProjectionState
 from dml.tracing import WEAVE_AVAILABLE, init_tracing
 
 # Load .env before checking for WANDB_API_KEY
@@ -41,23 +61,40 @@ if WEAVE_AVAILABLE:
     import weave
 
 
-def load_all_scripts() -> dict:
-    """Load all demo scripts from YAML file."""
-    prompts_file = Path(__file__).parent / "prompts.yaml"
-    if not prompts_file.exists():
-        raise FileNotFoundError(f"Demo prompts file not found: {prompts_file}")
-    with open(prompts_file) as f:
-        return yaml.safe_load(f)
+# Fields read from traced Event objects in Weave call inputs
+_EVENT_FIELDS = attrgetter("global_seq", "type", "payload")
+
+# Payload field shown in parentheses after an event's type in the events panel
+_EVENT_LABEL_FIELD = {
+    EventType.DecisionMade: "status",
+    EventType.ConstraintAdded: "priority",
+    EventType.ConstraintDeactivated: "priority",
+}
 
+# Event types that can change the facts, constraints or decisions panels
+_STATE_PANEL_EVENTS = frozenset({
+    EventType.FactAdded,
+    EventType.ConstraintAdded,
+    EventType.ConstraintDeactivated,
+    EventType.DecisionMade,
+    EventType.MemoryWriteCommitted,
+})
 
+# Event-type substring -> color, checked in order (first match wins)
+_EVENT_COLOR_RULES = (
+    ("fact", "cyan"),
+    ("constraint", "red"),
+    ("decision", "green"),
+    ("memorywrite", "yellow"),
+)
 
-def load_demo_prompts(name: str) -> dict:
-    """Load a specific demo script from YAML file."""
-    data = load_all_scripts()
-    if name not in data:
-        available = list(data.keys())
-        raise KeyError(f"Demo script '{name}' not found. Available: {available}")
-    return data[name]
+# Call attributes that may hold an op name, in order of preference
+_CALL_NAME_ATTRS = ("op_name", "display_name", "name", "op")
+
+# Sparkline glyphs for Weave latencies, lowest to highest
+_SPARK_CHARS = b" .:-=+*#%@"
+_SPARK_MAX = len(_SPARK_CHARS) - 1
+_SPARK_FLAT = chr(_SPARK_CHARS[len(_SPARK_CHARS) // 2])  # all samples equal
 
 
 # CSS for the app
@@ -289,6 +326,21 @@ class DemoApp(App):
         ("4", "select_script(4)", "Script 4"),
     ]
 
+    # Seconds a Weave get_calls() result is reused before querying again
+    WEAVE_FETCH_INTERVAL = 3.0
+    # Server-side started_at lower bound for Weave fetches (seconds, wall clock)
+    WEAVE_QUERY_WINDOW = 600
+    # DML poll period (seconds); it doubles after every DML_IDLE_TICKS empty
+    # polls while no prompt is running, up to DML_MAX_POLL_INTERVAL
+    DML_POLL_INTERVAL = 0.5
+    DML_MAX_POLL_INTERVAL = 5.0
+    DML_IDLE_TICKS = 4
+    # Turns (prompt + response widget pairs) kept in the chat pane
+    CHAT_HISTORY_TURNS = 20
+
+    # Event type -> panel color, filled by _event_color (event types are a small fixed set)
+    _EVENT_COLOR_CACHE: dict[str, str] = {}
+
     # Reactive state
     current_prompt_index = reactive(0)
     narrator_text = reactive("")
@@ -317,20 +369,63 @@ class DemoApp(App):
         self.script_selected = script_name is not None
         self.available_scripts = []
         # Create unique temp directory for this demo session (enables -c to work)
-        import tempfile
         self.session_id = str(uuid.uuid4())
         self.demo_dir = Path(tempfile.gettempdir()) / "dml-demo" / self.session_id
         self.demo_dir.mkdir(parents=True, exist_ok=True)
-        if self.debug_log:
-            self.debug_log.write_text(f"=== Demo session {self.session_id} ===\n")
-            self.debug_log.open("a").write(f"Demo dir: {self.demo_dir}\n")
+        # One line-buffered handle for the whole session (truncates the previous log)
+        self._debug_fp = open(self.debug_log, "w", buffering=1) if self.debug_log else None
+        if self._debug_fp:
+            self._debug_fp.write(
+                f"=== Demo session {self.session_id} ===\nDemo dir: {self.demo_dir}\n"
+            )
         # Track event count and timer for flash indicator
         self._last_event_count = 0
         self._flash_timer = None
+        # Highest global_seq rendered into the DML panels (-1 = never rendered)
+        self._last_seen_seq = -1
+        self._dml_refresh_timer = None
+        # Poll timer for refresh_dml_state, its current period, and how many
+        # polls in a row found nothing
+        self._dml_poll_timer = None
+        self._dml_poll_interval = self.DML_POLL_INTERVAL
+        self._dml_idle_ticks = 0
+        # Long-lived store shared by refreshes (opened lazily, closed around resets)
+        self._store: EventStore | None = None
+        # (st_dev, st_ino) of the database file the store was opened on; an
+        # outside reset replaces the file while our connection keeps the old one
+        self._store_file_id: tuple[int, int] | None = None
+        # Guards the projection and event caches, which the panel worker and
+        # the prompt snapshots build off the UI thread. The store handle and the
+        # UI thread's max_seq probe stay outside it, so a poll never waits on a
+        # rebuild.
+        self._state_lock = threading.RLock()
+        # Store the projection was built from; a different one means replay from seq 1
+        self._projection_store: EventStore | None = None
+        # Projection kept current incrementally from the shared store
+        self._projection = ProjectionEngine()
+        # Last markup rendered into each DML panel (by widget id)
+        self._panel_text: dict[str, str] = {}
+        # Rendered events-panel markup per global_seq (events are immutable)
+        self._event_lines: dict[int, str] = {}
+        # Last events fed to the projection, i.e. the events panel's window
+        self._event_tail: deque = deque(maxlen=50)
+        # Facts/constraints/decisions markup, rebuilt only after an event
+        # in _STATE_PANEL_EVENTS (None = rebuild on next refresh)
+        self._state_panel_texts: tuple[str, str, str] | None = None
         # Weave client for trace fetching
         self._weave_client = None
         self._weave_initialized = False
         self._last_trace_count = 0
+        # Buffered get_calls() result shared by refresh ticks until it expires
+        self._weave_calls: list = []
+        self._weave_calls_expire_at = 0.0
+        # Last trace-fetch worker; a blocking get_calls() can outlive its tick
+        self._weave_worker: Worker | None = None
+        # Cleared if the server rejects the started_at query expression
+        self._weave_query_supported = True
+        # Set while the started_at window is empty, so idle refetches skip
+        # straight to the unfiltered query
+        self._weave_window_empty = False
         self._weave_dashboard_url = (
             os.environ.get("WEAVE_DASHBOARD_URL")
             or os.environ.get("WANDB_DASHBOARD_URL")
@@ -342,11 +437,38 @@ class DemoApp(App):
         self._typewriter_timer = None
         self._highlight_sentences: list[str] = []
         self._highlight_idx: int = 0
-        self._highlight_ticks: int = 0
         self._static_suffix: str = ""
         self._intro_menu_text: str = ""
+        self._intro_texts: tuple[str, str, str] | None = None
         self._outro_text: str = "Demo complete!"
 
+    @classmethod
+    def install_uvloop(cls) -> bool:
+        """Run the app on uvloop when it is installed (optional 'fast' extra).
+
+        Must be called before App.run(). Returns True if uvloop's policy was set.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
+    @staticmethod
+    def _install_eager_tasks() -> bool:
+        """Use asyncio's eager task factory on Python 3.12+.
+
+        Short-lived tasks (widget updates, worker callbacks) then run to their
+        first await immediately instead of waiting for a loop iteration.
+        Must be called from inside the running loop.
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            return False
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+        return True
+
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
         yield Header(show_clock=True)
@@ -406,6 +528,24 @@ class DemoApp(App):
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
+        self._install_eager_tasks()
+
+        # Resolve pane handles once; these widgets live for the whole app
+        self._chat_scroll = self.query_one("#chat-scroll", VerticalScroll)
+        self._right_pane = self.query_one("#right-pane", VerticalScroll)
+        self._weave_pane = self.query_one("#weave-pane", Vertical)
+        self._weave_pane_content = self.query_one("#weave-pane-content", VerticalScroll)
+        self._intro_overlay = self.query_one("#intro-overlay", Vertical)
+        self._outro_overlay = self.query_one("#outro-overlay", Vertical)
+        self._status_bar = self.query_one("#status-bar", Static)
+        self._narrator = self.query_one("#narrator-content", Static)
+        self._weave_content = self.query_one("#weave-content", Static)
+        self._facts_w = self.query_one("#facts-content", Static)
+        self._constraints_w = self.query_one("#constraints-content", Static)
+        self._decisions_w = self.query_one("#decisions-content", Static)
+        self._events_w = self.query_one("#events-content", Static)
+        self._events_panel = self.query_one("#events-panel", Vertical)
+
         # Load available scripts
         try:
             all_scripts = load_all_scripts()
@@ -422,36 +562,48 @@ class DemoApp(App):
 
         # Initialize event count from store to avoid initial flash
         try:
-            store = EventStore(self.db_path)
-            self._last_event_count = len(store.get_events())
-            store.close()
+            self._last_event_count = self._get_store().count()
         except Exception:
-            pass  # Keep default of 0
+            self._close_store()  # Keep default of 0
 
         # Initialize Weave for tracing (if available)
         self._initialize_weave()
 
         # Allow focusing scroll panes for keyboard navigation
-        for selector in ("#chat-scroll", "#right-pane", "#weave-pane-content"):
-            try:
-                self.query_one(selector).can_focus = True
-            except Exception:
-                pass
+        for pane in (self._chat_scroll, self._right_pane, self._weave_pane_content):
+            pane.can_focus = True
 
         # Start DML state refresh
-        self.set_interval(0.5, self.refresh_dml_state)
+        self._set_dml_poll_interval(self.DML_POLL_INTERVAL)
         # Start Weave trace refresh (separate interval)
-        self.set_interval(1.0, self.refresh_weave_traces)
+        self.set_interval(1.0, self._tick_weave_traces)
 
     def _show_script_selection(self) -> None:
         """Show script selection on intro overlay."""
-        all_scripts = load_all_scripts()
+        # Built once; returning to the menu reuses the same text
+        if self._intro_texts is None:
+            self._intro_texts = self._build_intro_texts(load_all_scripts())
+        info_text, self._intro_menu_text, prompt_text = self._intro_texts
+
         intro_title = self.query_one("#intro-title", Static)
-        intro_content = self.query_one("#intro-content", Static)
         intro_prompt = self.query_one("#intro-prompt", Static)
 
         intro_title.update("[bold]Deterministic Memory Layer[/]")
 
+        # Use highlight effect for info section only
+        intro_prompt.update("")  # Hide until highlighting completes
+        self._start_typewriter(
+            info_text,
+            prompt_text,
+            target_id="#intro-content",
+            words_per_tick=4,
+            suffix_target_id="#intro-prompt",
+            static_suffix=self._intro_menu_text,  # Menu shown immediately below
+        )
+
+    @staticmethod
+    def _build_intro_texts(all_scripts: dict) -> tuple[str, str, str]:
+        """Build the intro overlay's (info, menu, prompt) text."""
         # Build informational content (highlighted)
         info_lines = [
             "[bold cyan]What is DML?[/]",
@@ -482,29 +634,15 @@ class DemoApp(App):
         for i, (key, script) in enumerate(all_scripts.items(), 1):
             name = script.get("name", key)
             desc = script.get("description", "")
-            menu_lines.append(f"  [bold cyan]{i}[/]  [bold]{name}[/]")
-            if desc:
-                menu_lines.append(f"      {desc}")
-            menu_lines.append("")
-
-        # Store menu text to append after highlighting completes
-        self._intro_menu_text = "\n".join(menu_lines)
+            entry = f"  [bold cyan]{i}[/]  [bold]{name}[/]\n"
+            menu_lines.append(f"{entry}      {desc}\n" if desc else entry)
 
-        # Use highlight effect for info section only
         num_scripts = len(all_scripts)
         if num_scripts <= 3:
             prompt_text = "[bold green]>>> Press 1, 2, or 3 to select  •  R to record  •  Q to quit <<<[/]"
         else:
             prompt_text = f"[bold green]>>> Press 1-{num_scripts} to select  •  R to record  •  Q to quit <<<[/]"
-        intro_prompt.update("")  # Hide until highlighting completes
-        self._start_typewriter(
-            "\n".join(info_lines),
-            prompt_text,
-            target_id="#intro-content",
-            words_per_tick=4,
-            suffix_target_id="#intro-prompt",
-            static_suffix=self._intro_menu_text,  # Menu shown immediately below
-        )
+        return "\n".join(info_lines), "\n".join(menu_lines), prompt_text
 
     def _load_script(self, script_name: str) -> None:
         """Load a specific script and populate overlays."""
@@ -518,20 +656,7 @@ class DemoApp(App):
             self.notify(f"Error loading script: {e}", severity="error")
             return
 
-        # Ensure DB parent directory exists
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # Reset DML database (--db must come before subcommand for Click)
-        result = subprocess.run(
-            ["uv", "run", "dml", "--db", self.db_path, "reset", "--force"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            self.notify(f"Reset failed: {result.stderr}", severity="error")
-
-        # Reset event count after clearing DB
-        self._last_event_count = 0
+        self._reset_database()
 
         # Refresh state display to show empty state
         self.refresh_dml_state()
@@ -570,13 +695,14 @@ class DemoApp(App):
 
     def action_toggle_observability(self) -> None:
         """Toggle the Weave observability pane visible/hidden."""
-        pane = self.query_one("#weave-pane", Vertical)
+        pane = self._weave_pane
         if pane.has_class("visible"):
             pane.remove_class("visible")
         else:
             pane.add_class("visible")
-            # Refresh traces when opening
-            self.refresh_weave_traces()
+            # Refresh traces when opening (skip the buffer so the pane starts fresh)
+            self._weave_calls_expire_at = 0.0
+            self._start_weave_refresh()
 
     def action_start_recording(self) -> None:
         """Start recording the demo with asciinema."""
@@ -586,7 +712,6 @@ class DemoApp(App):
             return
 
         # Check if asciinema is available
-        import shutil
         if not shutil.which("asciinema"):
             self.notify("asciinema not found. Install with: brew install asciinema", severity="error")
             return
@@ -642,7 +767,6 @@ class DemoApp(App):
             self._highlight_sentences = [p for p in parts if p.strip()]
 
         self._highlight_idx = 0
-        self._highlight_ticks = 0  # Ticks spent on current sentence
 
         if not self._highlight_sentences:
             # No text, just show suffix
@@ -658,8 +782,8 @@ class DemoApp(App):
         # Show initial state with first sentence highlighted
         self._update_highlight()
 
-        # Start the timer (tick every 150ms)
-        self._typewriter_timer = self.set_interval(0.15, self._typewriter_tick)
+        # One timer per sentence, sized to its word count
+        self._schedule_next_sentence()
 
     def _update_highlight(self) -> None:
         """Update display with current sentence highlighted."""
@@ -691,57 +815,43 @@ class DemoApp(App):
         except Exception:
             pass
 
-    def _typewriter_tick(self) -> None:
-        """Advance the sentence highlight."""
-        if self._highlight_idx >= len(self._highlight_sentences):
-            # Done - show final text and suffix
-            if self._typewriter_timer:
-                self._typewriter_timer.stop()
-                self._typewriter_timer = None
-
-            try:
-                target = self.query_one(self._typewriter_target, Static)
-                final_text = self._typewriter_text
-                if self._static_suffix:
-                    final_text += self._static_suffix
-                target.update(final_text)  # Show clean text
-
-                # Show suffix in appropriate location
-                if self._typewriter_suffix:
-                    if self._typewriter_suffix_target:
-                        self.query_one(self._typewriter_suffix_target, Static).update(self._typewriter_suffix)
-                    else:
-                        target.update(final_text + "\n\n" + self._typewriter_suffix)
-            except Exception:
-                pass
-            return
-
-        # Calculate how long to stay on this sentence based on word count
+    def _schedule_next_sentence(self) -> None:
+        """Arm a one-shot timer for how long the current sentence stays highlighted."""
         current_sentence = self._highlight_sentences[self._highlight_idx]
-        word_count = len(current_sentence.split())
-        # ~250 words per minute = ~4 words per second = ~0.6 ticks per word at 150ms
-        ticks_needed = max(2, int(word_count * 0.6))
-
-        self._highlight_ticks += 1
-        if self._highlight_ticks >= ticks_needed:
-            # Move to next sentence
-            self._highlight_idx += 1
-            self._highlight_ticks = 0
+        # ~250 words per minute = ~0.09s per word, at least 0.3s per sentence
+        delay = max(0.3, len(current_sentence.split()) * 0.09)
+        self._typewriter_timer = self.set_timer(delay, self._advance_sentence)
+
+    def _advance_sentence(self) -> None:
+        """Advance the sentence highlight, finishing after the last sentence."""
+        self._typewriter_timer = None
+        self._highlight_idx += 1
+        if self._highlight_idx < len(self._highlight_sentences):
             self._update_highlight()
+            self._schedule_next_sentence()
+            return
 
-    def _pane_focusables(self) -> list:
-        focusables = []
-        for selector in ("#chat-scroll", "#right-pane"):
-            try:
-                focusables.append(self.query_one(selector))
-            except Exception:
-                pass
+        # Done - show final text and suffix
         try:
-            weave_pane = self.query_one("#weave-pane", Vertical)
-            if weave_pane.has_class("visible"):
-                focusables.append(self.query_one("#weave-pane-content"))
+            target = self.query_one(self._typewriter_target, Static)
+            final_text = self._typewriter_text
+            if self._static_suffix:
+                final_text += self._static_suffix
+            target.update(final_text)  # Show clean text
+
+            # Show suffix in appropriate location
+            if self._typewriter_suffix:
+                if self._typewriter_suffix_target:
+                    self.query_one(self._typewriter_suffix_target, Static).update(self._typewriter_suffix)
+                else:
+                    target.update(final_text + "\n\n" + self._typewriter_suffix)
         except Exception:
             pass
+
+    def _pane_focusables(self) -> list:
+        focusables = [self._chat_scroll, self._right_pane]
+        if self._weave_pane.has_class("visible"):
+            focusables.append(self._weave_pane_content)
         return focusables
 
     def action_focus_next_pane(self) -> None:
@@ -775,13 +885,20 @@ class DemoApp(App):
         if not os.environ.get("WANDB_API_KEY"):
             return
 
+        self._connect_weave()
+
+    @work(thread=True, group="weave-init")
+    def _connect_weave(self) -> None:
+        """Run weave.init (a network round trip) off the UI thread."""
         try:
             # Initialize Weave - use same project as MCP server
-            self._weave_client = weave.init("dml-mcp-server")
-            self._weave_initialized = True
-            self.notify("Weave tracing enabled", severity="information")
+            client = weave.init("dml-mcp-server")
         except Exception as e:
-            self.notify(f"Weave init failed: {e}", severity="warning")
+            self.call_from_thread(self.notify, f"Weave init failed: {e}", severity="warning")
+            return
+        self._weave_client = client
+        self._weave_initialized = True
+        self.call_from_thread(self.notify, "Weave tracing enabled", severity="information")
 
     @staticmethod
     def _coerce_datetime(value):
@@ -794,18 +911,18 @@ class DemoApp(App):
         return value
 
     @classmethod
-    def _weave_duration_ms(cls, call) -> int | None:
-        started = cls._coerce_datetime(getattr(call, "started_at", None))
+    def _weave_duration_ms(cls, call, started: datetime | None) -> int | None:
+        """Call duration, given its already-coerced start time."""
         ended = cls._coerce_datetime(getattr(call, "ended_at", None))
         if started and ended:
             return int((ended - started).total_seconds() * 1000)
         return None
 
     @staticmethod
-    def _percentile(values: list[int], pct: float) -> int | None:
-        if not values:
+    def _percentile(vals: list[int], pct: float) -> int | None:
+        """Interpolated percentile of vals, which must already be sorted."""
+        if not vals:
             return None
-        vals = sorted(values)
         if len(vals) == 1:
             return vals[0]
         k = (pct / 100.0) * (len(vals) - 1)
@@ -823,18 +940,17 @@ class DemoApp(App):
         series = values[-width:]
         low = min(series)
         high = max(series)
-        chars = " .:-=+*#%@"
         if high == low:
-            return chars[len(chars) // 2] * len(series)
-        out = []
-        for val in series:
-            idx = int((val - low) / (high - low) * (len(chars) - 1))
-            out.append(chars[idx])
-        return "".join(out)
+            return _SPARK_FLAT * len(series)
+        span = high - low
+        out = bytearray(len(series))
+        for i, val in enumerate(series):
+            out[i] = _SPARK_CHARS[int((val - low) * _SPARK_MAX // span)]
+        return out.decode("ascii")
 
-    @classmethod
-    def _format_relative_time(cls, value, now) -> str:
-        dt = cls._coerce_datetime(value)
+    @staticmethod
+    def _format_relative_time(dt: datetime | None, now) -> str:
+        """'12s'/'3m'/... since an already-coerced start time."""
         if dt is None:
             return "?"
         delta = now - dt
@@ -884,9 +1000,13 @@ class DemoApp(App):
             ev_type = event_obj.get("type")
             payload = event_obj.get("payload")
         else:
-            seq = getattr(event_obj, "global_seq", None) or getattr(event_obj, "seq", None)
-            ev_type = getattr(event_obj, "type", None)
-            payload = getattr(event_obj, "payload", None)
+            try:
+                seq, ev_type, payload = _EVENT_FIELDS(event_obj)
+            except AttributeError:
+                seq = getattr(event_obj, "global_seq", None)
+                ev_type = getattr(event_obj, "type", None)
+                payload = getattr(event_obj, "payload", None)
+            seq = seq or getattr(event_obj, "seq", None)
         if hasattr(ev_type, "value"):
             ev_type = ev_type.value
         if seq is None and isinstance(output, int):
@@ -895,32 +1015,49 @@ class DemoApp(App):
             return seq, str(ev_type) if ev_type is not None else None, payload
         return seq, str(ev_type) if ev_type is not None else None, None
 
-    @staticmethod
-    def _event_color(event_type: str | None) -> str:
+    @classmethod
+    def _event_color(cls, event_type: str | None) -> str:
         if not event_type:
             return "magenta"
+        color = cls._EVENT_COLOR_CACHE.get(event_type)
+        if color is None:
+            color = cls._EVENT_COLOR_CACHE[event_type] = cls._compute_event_color(event_type)
+        return color
+
+    @staticmethod
+    def _compute_event_color(event_type: str) -> str:
         et = event_type.lower()
-        if "fact" in et:
-            return "cyan"
-        if "constraint" in et:
-            return "red"
-        if "decision" in et:
-            return "green"
-        if "memorywrite" in et:
-            return "yellow"
+        for needle, color in _EVENT_COLOR_RULES:
+            if needle in et:
+                return color
         return "blue"
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _weave_row_prefix(color: str, error: bool) -> str:
+        """Status symbol and opening color tag for a Weave event row."""
+        status_color, status_symbol = ("red", "!") if error else (color, "•")
+        return f"  [{status_color}]{status_symbol}[/] [{color}]"
+
+    @staticmethod
+    def _payload_snippet(payload) -> str | None:
+        """'key=value' for the payload's first entry, or None if there is none."""
+        if isinstance(payload, dict) and payload:
+            key, value = next(iter(payload.items()))
+            return f"{key}={value}"
+        return None
+
     @staticmethod
     def _payload_summary(payload: dict | None, limit_keys: int = 3) -> str:
         if not isinstance(payload, dict) or not payload:
             return ""
         parts = []
-        for idx, (key, value) in enumerate(payload.items()):
-            if idx >= limit_keys:
-                break
-            text = str(value).replace("\n", " ")
+        for key, value in islice(payload.items(), limit_keys):
+            # Truncate before flattening newlines (same length either way)
+            text = str(value)
             if len(text) > 24:
                 text = text[:21] + "..."
+            text = text.replace("\n", " ")
             parts.append(f"{key}={text}")
         remaining = len(payload) - limit_keys
         if remaining > 0:
@@ -929,141 +1066,76 @@ class DemoApp(App):
 
     @classmethod
     def _call_name(cls, call) -> str:
-        for attr in ("op_name", "display_name", "name", "op"):
-            val = getattr(call, attr, None)
+        # Weave calls are plain dataclasses: read fields straight from __dict__
+        fields = getattr(call, "__dict__", None) or {}
+        for attr in _CALL_NAME_ATTRS:
+            val = fields[attr] if attr in fields else getattr(call, attr, None)
             if hasattr(val, "name"):
                 val = getattr(val, "name", None)
             if isinstance(val, str) and val:
                 return val
         return "unknown"
 
-    @classmethod
-    def _call_label_and_detail(cls, call) -> tuple[str, str | None]:
-        name = cls._call_name(call)
-        short = name.split(".")[-1] if "." in name else name
-        if ":" in short and len(short) > 16:
-            short = short.split(":", 1)[0]
+    def _tick_weave_traces(self) -> None:
+        """Interval callback: only fetch traces while the Weave pane is visible."""
+        if self._weave_pane.has_class("visible"):
+            self._start_weave_refresh()
 
-        detail = None
-        inputs = getattr(call, "inputs", None)
-        output = getattr(call, "output", None)
-        name_lower = name.lower()
-        if "event.append" in name_lower:
-            seq = None
-            if isinstance(output, int):
-                seq = output
-            if isinstance(inputs, dict):
-                event_obj = inputs.get("event")
-                if event_obj is not None:
-                    if isinstance(event_obj, dict):
-                        if seq is None:
-                            seq = event_obj.get("global_seq") or event_obj.get("seq")
-                        ev_type = event_obj.get("type")
-                        payload = event_obj.get("payload")
-                    else:
-                        if seq is None:
-                            seq = getattr(event_obj, "global_seq", None) or getattr(event_obj, "seq", None)
-                        ev_type = getattr(event_obj, "type", None)
-                        payload = getattr(event_obj, "payload", None)
-                    if hasattr(ev_type, "value"):
-                        ev_type = ev_type.value
-                    payload_snippet = None
-                    if isinstance(payload, dict) and payload:
-                        key = next(iter(payload.keys()))
-                        payload_snippet = f"{key}={payload.get(key)}"
-                    parts = []
-                    if seq is not None:
-                        parts.append(f"#{seq}")
-                    if ev_type:
-                        parts.append(str(ev_type))
-                    if payload_snippet:
-                        parts.append(payload_snippet)
-                    if parts:
-                        detail = " ".join(parts)
-
-        if isinstance(inputs, dict):
-            if "key" in inputs and "value" in inputs:
-                detail = f"{inputs.get('key')} = {inputs.get('value')}"
-            elif "query" in inputs:
-                detail = str(inputs.get("query"))
-            elif "items" in inputs and isinstance(inputs.get("items"), list):
-                detail = f"{len(inputs.get('items'))} items"
-            elif "event" in inputs:
-                event = inputs.get("event")
-                event_type = getattr(event, "type", None)
-                if event_type is not None:
-                    detail = str(event_type)
-                payload = getattr(event, "payload", None)
-                if isinstance(payload, dict) and payload:
-                    key = next(iter(payload.keys()))
-                    detail = f"{detail + ' ' if detail else ''}{key}={payload.get(key)}"
-
-        if detail is not None:
-            detail = cls._truncate(str(detail), 40)
-
-        if short.startswith("dml.memory."):
-            short = short.split("dml.memory.", 1)[-1]
-        if short.startswith("dml.event."):
-            short = short.split("dml.event.", 1)[-1]
-
-        return short, detail
+    def _start_weave_refresh(self) -> None:
+        """Start a trace fetch unless the previous one is still in flight.
 
-    def refresh_weave_traces(self) -> None:
-        """Refresh the Weave observability pane."""
-        weave_content = self.query_one("#weave-content", Static)
-        weave_pane = self.query_one("#weave-pane", Vertical)
+        Thread workers can't be interrupted, so exclusive=True alone would let
+        a slow get_calls() pile up one blocked thread per tick.
+        """
+        if self._weave_worker is None or self._weave_worker.is_finished:
+            self._weave_worker = self.refresh_weave_traces()
 
+    @work(exclusive=True, thread=True, group="weave")
+    def refresh_weave_traces(self) -> None:
+        """Fetch recent Weave calls off the UI thread and render the pane."""
+        worker = get_current_worker()
         # If Weave not available or not initialized, show setup instructions
         if not self._weave_initialized or not self._weave_client:
-            if WEAVE_AVAILABLE and not os.environ.get("WANDB_API_KEY"):
-                weave_content.update(
-                    "[bold]Observability[/] [dim](Weave provider)[/]\n"
-                    f"[dim]Dashboard:[/] {self._weave_dashboard_url}\n\n"
-                    "[dim]Not configured. To enable:[/]\n"
-                    "1. Sign up at wandb.ai\n"
-                    "2. Get API key from wandb.ai/authorize\n"
-                    "3. Set WANDB_API_KEY in .env file"
-                )
-            elif not WEAVE_AVAILABLE:
-                weave_content.update(
-                    "[bold]Observability[/] [dim](Weave provider)[/]\n"
-                    f"[dim]Dashboard:[/] {self._weave_dashboard_url}\n\n"
-                    "[dim]Weave package not installed.[/]"
-                )
-            else:
-                weave_content.update(
-                    "[bold]Observability[/] [dim](Weave provider)[/]\n"
-                    f"[dim]Dashboard:[/] {self._weave_dashboard_url}\n\n"
-                    "[dim]Weave not initialized[/]"
-                )
-            return
+            text, call_count = self._weave_setup_text(), None
+        else:
+            try:
+                text, call_count = self._render_weave_calls()
+            except Exception as e:
+                text, call_count = f"[red]Weave error: {rich_escape(str(e))}[/]", None
+        if not worker.is_cancelled:
+            self.call_from_thread(self._apply_weave_traces, text, call_count)
+
+    def _weave_setup_text(self) -> str:
+        """Setup instructions shown when Weave tracing is unavailable."""
+        if WEAVE_AVAILABLE and not os.environ.get("WANDB_API_KEY"):
+            return (
+                "[bold]Observability[/] [dim](Weave provider)[/]\n"
+                f"[dim]Dashboard:[/] {self._weave_dashboard_url}\n\n"
+                "[dim]Not configured. To enable:[/]\n"
+                "1. Sign up at wandb.ai\n"
+                "2. Get API key from wandb.ai/authorize\n"
+                "3. Set WANDB_API_KEY in .env file"
+            )
+        if not WEAVE_AVAILABLE:
+            return (
+                "[bold]Observability[/] [dim](Weave provider)[/]\n"
+                f"[dim]Dashboard:[/] {self._weave_dashboard_url}\n\n"
+                "[dim]Weave package not installed.[/]"
+            )
+        return (
+            "[bold]Observability[/] [dim](Weave provider)[/]\n"
+            f"[dim]Dashboard:[/] {self._weave_dashboard_url}\n\n"
+            "[dim]Weave not initialized[/]"
+        )
 
-        try:
-            # Fetch recent traces from Weave
-            calls = list(self._weave_client.get_calls(
-                limit=50,
-                sort_by=[{"field": "started_at", "direction": "desc"}],
-            ))
-            # Filter to last 2 minutes for recency (relative to latest call to avoid clock skew)
-            now = datetime.now(timezone.utc)
-            started_times = [
-                self._coerce_datetime(getattr(call, "started_at", None))
-                for call in calls
-            ]
-            started_times = [t for t in started_times if t is not None]
-            if started_times:
-                latest = max(started_times)
-                cutoff = latest - timedelta(seconds=120)
-                recent_calls = []
-                for call in calls:
-                    started = self._coerce_datetime(getattr(call, "started_at", None))
-                    if started and started >= cutoff:
-                        recent_calls.append(call)
-                if recent_calls:
-                    calls = recent_calls
+    def _apply_weave_traces(self, text: str, call_count: int | None) -> None:
+        """Update the Weave pane on the UI thread (call_count None = no flash check)."""
+        weave_content = self._weave_content
+        weave_pane = self._weave_pane
 
+        if call_count is not None:
             # Flash indicator for new traces
-            if len(calls) > self._last_trace_count and weave_pane.has_class("visible"):
+            if call_count > self._last_trace_count and weave_pane.has_class("visible"):
                 weave_pane.add_class("flash")
                 if self._flash_timer:
                     self._flash_timer.stop()
@@ -1073,130 +1145,267 @@ class DemoApp(App):
                     self._flash_timer = None
 
                 self._flash_timer = self.set_timer(0.3, clear_flash)
-            self._last_trace_count = len(calls)
+            self._last_trace_count = call_count
 
-            if calls:
-                # now already computed above
-                durations = []
-                recent_60s = 0
-                errors = 0
-                for call in calls:
-                    duration_ms = self._weave_duration_ms(call)
-                    if duration_ms is not None:
-                        durations.append(duration_ms)
-                    started = self._coerce_datetime(getattr(call, "started_at", None))
-                    if started and now - started <= timedelta(seconds=60):
-                        recent_60s += 1
-                    if getattr(call, "error", None) or getattr(call, "exception", None):
-                        errors += 1
-
-                p50 = self._percentile(durations, 50)
-                p95 = self._percentile(durations, 95)
-                spark = self._sparkline(durations, width=20)
-
-                lines = [
-                    "[bold cyan]Observability[/] [dim](Weave calls, last 2 minutes)[/]",
-                    f"[dim]Dashboard:[/] {self._weave_dashboard_url}",
-                    f"[dim]Updated {now.strftime('%H:%M:%S')}[/]  "
-                    f"[bold]Total[/]: {len(calls)}  "
-                    f"[bold]1m[/]: {recent_60s}  "
-                    f"[bold]Errors[/]: {errors}",
-                    f"[bold]Latency[/]: "
-                    f"p50 {p50 if p50 is not None else '--'}ms  "
-                    f"p95 {p95 if p95 is not None else '--'}ms",
-                ]
-
-                if spark:
-                    lines.append(f"[dim]Spark[/]: {spark}")
-                lines.append("")
-
-                event_calls = []
-                other_calls = 0
-                for call in calls[:25]:
-                    inputs = getattr(call, "inputs", None)
-                    if isinstance(inputs, dict) and "event" in inputs:
-                        event_calls.append(call)
-                    else:
-                        other_calls += 1
-
-                lines.append(
-                    f"[bold]DML Events (from Weave)[/]: {len(event_calls)}  "
-                    f"[dim]Other calls: {other_calls}[/]"
-                )
+        weave_content.update(text)
+
+    def _fetch_weave_calls(self) -> list:
+        """Recent Weave calls, re-fetched at most every WEAVE_FETCH_INTERVAL seconds.
 
-                groups: dict[str, list] = {}
-                for call in event_calls:
-                    seq, ev_type, payload = self._event_from_call(call)
-                    label = ev_type or "Unknown"
-                    groups.setdefault(label, []).append((call, seq, payload))
-
-                if not groups:
-                    lines.append("[dim]No DML events in recent Weave calls yet.[/]")
-                    if calls:
-                        lines.append("[dim]Recent Weave calls:[/]")
-                        for call in calls[:5]:
-                            name = self._call_name(call)
-                            inputs = getattr(call, "inputs", None)
-                            attrs = getattr(call, "attributes", None)
-                            input_keys = []
-                            if isinstance(inputs, dict):
-                                input_keys = list(inputs.keys())
-                            attr_keys = []
-                            if isinstance(attrs, dict):
-                                attr_keys = list(attrs.keys())
-                            name_text = self._truncate(name, 36)
-                            keys_text = self._truncate(", ".join(input_keys), 28) if input_keys else "-"
-                            attrs_text = self._truncate(", ".join(attr_keys), 28) if attr_keys else "-"
-                            lines.append(
-                                f"  [dim]{name_text}[/] [dim]inputs:[/] {keys_text} [dim]attrs:[/] {attrs_text}"
-                            )
+        The pane re-renders every second (relative times keep moving), but the
+        network query only runs when the buffered result has expired.
+        """
+        now = time.monotonic()
+        if now >= self._weave_calls_expire_at:
+            calls = []
+            # Let the server drop old calls; the 2-minute window is still
+            # applied locally, relative to the latest call (clock skew)
+            cutoff = time.time() - self.WEAVE_QUERY_WINDOW
+            if self._weave_query_supported and not self._weave_window_empty:
+                try:
+                    calls = self._query_weave_calls({
+                        "$expr": {"$gte": [{"$getField": "started_at"}, {"$literal": cutoff}]}
+                    })
+                except Exception as e:
+                    if not self._is_rejected_query(e):
+                        raise
+                    self._weave_query_supported = False
+                    if self._debug_fp:
+                        self._debug_fp.write(f"\n--- Weave started_at query rejected ---\n{e}\n")
                 else:
-                    lines.append("")
-                    for label in sorted(groups.keys()):
-                        color = self._event_color(label)
-                        lines.append(f"[bold]{label}[/] [dim]({len(groups[label])})[/]")
-                        for call, seq, payload in groups[label][:3]:
-                            duration_ms = self._weave_duration_ms(call)
-                            started = getattr(call, "started_at", None)
-                            rel = self._format_relative_time(started, now)
-                            error = getattr(call, "error", None) or getattr(call, "exception", None)
-                            status_symbol = "!" if error else "•"
-                            status_color = "red" if error else color
-                            seq_text = f"#{seq}" if seq is not None else "#?"
-                            payload_snippet = None
-                            if isinstance(payload, dict) and payload:
-                                key = next(iter(payload.keys()))
-                                payload_snippet = f"{key}={payload.get(key)}"
-                            timing = f"{duration_ms}ms" if duration_ms is not None else "?"
-                            if payload_snippet:
-                                payload_snippet = self._truncate(str(payload_snippet), 32)
-                                lines.append(
-                                    f"  [{status_color}]{status_symbol}[/] "
-                                    f"[{color}]{seq_text}[/] [dim]{payload_snippet}  {timing} {rel}[/]"
-                                )
-                            else:
-                                lines.append(
-                                    f"  [{status_color}]{status_symbol}[/] "
-                                    f"[{color}]{seq_text}[/] [dim]{timing} {rel}[/]"
-                                )
-                        if len(groups[label]) > 3:
-                            lines.append(f"  [dim]... +{len(groups[label]) - 3} more[/]")
-
-                weave_content.update("\n".join(lines))
-            else:
-                weave_content.update("[dim]No Weave traces yet... Run the demo to generate traces.[/]")
+                    self._weave_window_empty = not calls
+            if not calls:
+                # Nothing recent (or no server-side filtering): show the latest calls
+                calls = self._query_weave_calls(None)
+                if self._weave_window_empty:
+                    # Stay on this single query while idle; filter again once
+                    # the newest call falls inside the window
+                    newest = self._coerce_datetime(getattr(calls[0], "started_at", None)) if calls else None
+                    self._weave_window_empty = newest is None or newest.timestamp() < cutoff
+            self._weave_calls = calls
+            self._weave_calls_expire_at = now + self.WEAVE_FETCH_INTERVAL
+        return self._weave_calls
 
-        except Exception as e:
-            weave_content.update(f"[red]Weave error: {rich_escape(str(e))}[/]")
+    @staticmethod
+    def _is_rejected_query(error: Exception) -> bool:
+        """True if get_calls() failed on the query expression itself, not transiently.
+
+        Client-side validation raises ValueError/TypeError; the server answers
+        a bad expression with 400/422. Anything else (timeouts, 5xx, auth) is
+        left to the caller so one flaky request doesn't disable the filter.
+        """
+        if isinstance(error, (ValueError, TypeError)):
+            return True
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        return status in (400, 422)
+
+    def _query_weave_calls(self, query: dict | None) -> list:
+        """Fetch the newest Weave calls, optionally narrowed by a Weave query expression."""
+        kwargs = {}
+        if query is not None:
+            kwargs["query"] = query
+        return list(self._weave_client.get_calls(
+            limit=50,
+            sort_by=[{"field": "started_at", "direction": "desc"}],
+            **kwargs,
+        ))
+
+    def _render_weave_calls(self) -> tuple[str, int]:
+        """Fetch recent Weave calls and build the pane text (blocking network I/O).
+
+        Returns:
+            Tuple of (pane markup, number of calls shown).
+        """
+        calls = self._fetch_weave_calls()
+        # Filter to last 2 minutes for recency (relative to latest call to avoid clock skew)
+        now = datetime.now(timezone.utc)
+        # Coerce each call's start time once; the filter and stats below reuse it
+        timed_calls = [
+            (call, self._coerce_datetime(getattr(call, "started_at", None)))
+            for call in calls
+        ]
+        started_times = [t for _, t in timed_calls if t is not None]
+        if started_times:
+            cutoff = max(started_times) - timedelta(seconds=120)
+            recent = [(call, t) for call, t in timed_calls if t and t >= cutoff]
+            if recent:
+                timed_calls = recent
+        calls = [call for call, _ in timed_calls]
+
+        if not calls:
+            return "[dim]No Weave traces yet... Run the demo to generate traces.[/]", 0
+
+        durations = []
+        # Per-call durations, aligned with timed_calls, reused by the rows below
+        call_durations = []
+        recent_60s = 0
+        errors = 0
+        minute_ago = now - timedelta(seconds=60)
+        for call, started in timed_calls:
+            duration_ms = self._weave_duration_ms(call, started)
+            call_durations.append(duration_ms)
+            if duration_ms is not None:
+                durations.append(duration_ms)
+            if started and started >= minute_ago:
+                recent_60s += 1
+            if getattr(call, "error", None) or getattr(call, "exception", None):
+                errors += 1
+
+        # Sort once for both percentiles; the sparkline keeps call order
+        sorted_durations = sorted(durations)
+        p50 = self._percentile(sorted_durations, 50)
+        p95 = self._percentile(sorted_durations, 95)
+        spark = self._sparkline(durations, width=20)
+
+        lines = [
+            "[bold cyan]Observability[/] [dim](Weave calls, last 2 minutes)[/]",
+            f"[dim]Dashboard:[/] {self._weave_dashboard_url}",
+            f"[dim]Updated {now.strftime('%H:%M:%S')}[/]  "
+            f"[bold]Total[/]: {len(calls)}  "
+            f"[bold]1m[/]: {recent_60s}  "
+            f"[bold]Errors[/]: {errors}",
+            f"[bold]Latency[/]: "
+            f"p50 {p50 if p50 is not None else '--'}ms  "
+            f"p95 {p95 if p95 is not None else '--'}ms",
+        ]
+
+        if spark:
+            lines.append(f"[dim]Spark[/]: {spark}")
+        lines.append("")
+
+        # Classify and group the newest calls in one pass
+        event_call_count = 0
+        other_calls = 0
+        groups: dict[str, list] = {}
+        for (call, started), duration_ms in islice(zip(timed_calls, call_durations), 25):
+            inputs = getattr(call, "inputs", None)
+            if not (isinstance(inputs, dict) and "event" in inputs):
+                other_calls += 1
+                continue
+            event_call_count += 1
+            seq, ev_type, payload = self._event_from_call(call)
+            groups.setdefault(ev_type or "Unknown", []).append(
+                (call, seq, payload, started, duration_ms)
+            )
+
+        lines.append(
+            f"[bold]DML Events (from Weave)[/]: {event_call_count}  "
+            f"[dim]Other calls: {other_calls}[/]"
+        )
+
+        if not groups:
+            lines.append("[dim]No DML events in recent Weave calls yet.[/]")
+            if calls:
+                lines.append("[dim]Recent Weave calls:[/]")
+                for call in calls[:5]:
+                    name = self._call_name(call)
+                    inputs = getattr(call, "inputs", None)
+                    attrs = getattr(call, "attributes", None)
+                    input_keys = []
+                    if isinstance(inputs, dict):
+                        input_keys = list(inputs.keys())
+                    attr_keys = []
+                    if isinstance(attrs, dict):
+                        attr_keys = list(attrs.keys())
+                    name_text = self._truncate(name, 36)
+                    keys_text = self._truncate(", ".join(input_keys), 28) if input_keys else "-"
+                    attrs_text = self._truncate(", ".join(attr_keys), 28) if attr_keys else "-"
+                    lines.append(
+                        f"  [dim]{name_text}[/] [dim]inputs:[/] {keys_text} [dim]attrs:[/] {attrs_text}"
+                    )
+        else:
+            lines.append("")
+            for label in sorted(groups):
+                group = groups[label]
+                color = self._event_color(label)
+                lines.append(f"[bold]{label}[/] [dim]({len(group)})[/]")
+                # Only the first three calls per group are shown; format just those
+                for call, seq, payload, started, duration_ms in group[:3]:
+                    error = getattr(call, "error", None) or getattr(call, "exception", None)
+                    snippet = self._payload_snippet(payload)
+                    snippet = self._truncate(snippet, 32) + "  " if snippet else ""
+                    timing = f"{duration_ms}ms" if duration_ms is not None else "?"
+                    rel = self._format_relative_time(started, now)
+                    prefix = self._weave_row_prefix(color, bool(error))
+                    lines.append(
+                        f"{prefix}#{seq if seq is not None else '?'}[/] [dim]{snippet}{timing} {rel}[/]"
+                    )
+                if len(group) > 3:
+                    lines.append(f"  [dim]... +{len(group) - 3} more[/]")
+
+        return "\n".join(lines), len(calls)
 
     def action_quit(self) -> None:
         """Quit the app and clean up temp directory."""
         self._cleanup_demo_dir()
+        self._close_store()
         self.exit()
 
+    def on_unmount(self) -> None:
+        """Close the shared EventStore and debug log when the app shuts down."""
+        self._close_store()
+        if self._debug_fp:
+            self._debug_fp.close()
+            self._debug_fp = None
+
+    def _get_store(self) -> EventStore:
+        """Return the shared EventStore, opening it on first use.
+
+        Connections are per thread, so the UI thread and workers share the
+        handle without locking.
+        """
+        store = self._store
+        if store is None:
+            store = self._store = EventStore(self.db_path)
+            self._store_file_id = self._db_file_id()
+        return store
+
+    def _db_file_id(self) -> tuple[int, int] | None:
+        """Identity of the database file on disk, or None if it is missing."""
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return st.st_dev, st.st_ino
+
+    def _close_store(self) -> None:
+        """Close the shared EventStore; the next access reopens it and replays from scratch."""
+        store, self._store = self._store, None
+        if store is not None:
+            store.close()
+
+    def _reset_projection(self) -> None:
+        """Forget everything derived from the log so the next read replays from seq 1."""
+        self._projection = ProjectionEngine()
+        self._event_lines = {}
+        self._event_tail.clear()
+        self._state_panel_texts = None
+
+    def _current_state(self) -> ProjectionState:
+        """Return DML state, applying only events appended since the last call.
+
+        The same new events also feed the events panel's tail window, so
+        rendering it needs no query of its own.
+        """
+        store = self._get_store()
+        with self._state_lock:
+            if (
+                store is not self._projection_store
+                or store.get_max_seq() < self._projection.state.last_seq
+            ):
+                # Store was reopened, or the log shrank under us; rebuild from seq 1
+                self._reset_projection()
+                self._projection_store = store
+            new_events = store.get_events(from_seq=self._projection.state.last_seq + 1)
+            for event in new_events:
+                self._projection.apply_event(event)
+                if event.type in _STATE_PANEL_EVENTS:
+                    self._state_panel_texts = None
+            self._event_tail.extend(new_events)
+            return self._projection.state
+
     def _cleanup_demo_dir(self) -> None:
         """Remove the temp demo directory."""
-        import shutil
         if self.demo_dir and self.demo_dir.exists():
             try:
                 shutil.rmtree(self.demo_dir)
@@ -1219,8 +1428,7 @@ class DemoApp(App):
         if not self.demo_started:
             # First press after script selected - hide intro and start
             self.demo_started = True
-            intro_overlay = self.query_one("#intro-overlay")
-            intro_overlay.add_class("hidden")
+            self._intro_overlay.add_class("hidden")
             self.reset_demo()
             self.run_next_prompt()
         elif self.current_prompt_index < len(self.prompts):
@@ -1228,8 +1436,7 @@ class DemoApp(App):
         else:
             # Show outro overlay with typewriter effect
             self.demo_complete = True
-            outro_overlay = self.query_one("#outro-overlay")
-            outro_overlay.add_class("visible")
+            self._outro_overlay.add_class("visible")
             self._start_typewriter(
                 self._outro_text,
                 "[bold green]>>> Press ENTER/SPACE to return to menu, Q to quit <<<[/]",
@@ -1251,45 +1458,45 @@ class DemoApp(App):
         self.prompts = []
 
         # Create new demo directory for next run
-        import tempfile
         self.session_id = str(uuid.uuid4())
         self.demo_dir = Path(tempfile.gettempdir()) / "dml-demo" / self.session_id
         self.demo_dir.mkdir(parents=True, exist_ok=True)
 
         # Hide outro, show intro with menu
-        outro_overlay = self.query_one("#outro-overlay")
-        outro_overlay.remove_class("visible")
-
-        intro_overlay = self.query_one("#intro-overlay")
-        intro_overlay.remove_class("hidden")
+        self._outro_overlay.remove_class("visible")
+        self._intro_overlay.remove_class("hidden")
 
         # Clear chat
-        chat_scroll = self.query_one("#chat-scroll", VerticalScroll)
-        chat_scroll.remove_children()
+        self._chat_scroll.remove_children()
 
         # Show selection menu
         self._show_script_selection()
 
     def reset_demo(self) -> None:
         """Reset DML database for fresh demo."""
+        self._reset_database()
+        # Clear chat
+        self._chat_scroll.remove_children()
+        # Refresh state display to show empty state
+        self.refresh_dml_state()
+
+    def _reset_database(self) -> None:
+        """Clear the DML database in-process and forget what the panels rendered."""
         # Ensure DB parent directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Reset DML database (--db must come before subcommand for Click)
-        result = subprocess.run(
-            ["uv", "run", "dml", "--db", self.db_path, "reset", "--force"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            self.notify(f"Reset failed: {result.stderr}", severity="error")
-        # Reset event count after clearing DB
+        # Release our connection so the reset can delete the database files
+        self._close_store()
+
+        try:
+            for warning in reset_database(self.db_path):
+                self.notify(f"Reset warning: {warning}", severity="warning")
+        except Exception as e:
+            self.notify(f"Reset failed: {e}", severity="error")
+
+        # Reset event count after clearing DB (seqs restart, so force a re-render)
         self._last_event_count = 0
-        # Clear chat
-        chat_scroll = self.query_one("#chat-scroll")
-        chat_scroll.remove_children()
-        # Refresh state display to show empty state
-        self.refresh_dml_state()
+        self._last_seen_seq = -1
 
     @work(exclusive=True)
     async def run_next_prompt(self) -> None:
@@ -1304,9 +1511,9 @@ class DemoApp(App):
         narrator_text = prompt_data.get("narrator", "").strip()
 
         # Get UI elements
-        status_bar = self.query_one("#status-bar", Static)
-        narrator = self.query_one("#narrator-content", Static)
-        chat_scroll = self.query_one("#chat-scroll", VerticalScroll)
+        status_bar = self._status_bar
+        narrator = self._narrator
+        chat_scroll = self._chat_scroll
 
         # Show context in narrator before sending (with karaoke effect)
         if context_text:
@@ -1323,53 +1530,98 @@ class DemoApp(App):
             "[dim](ENTER/SPACE to proceed, Q to quit, O for observability)[/]"
         )
 
-        # Add user message to chat with > prefix
-        user_lines = prompt.split('\n')
-        user_text = ""
-        for i, line in enumerate(user_lines):
-            prefix = "> " if i == 0 else "  "
-            user_text += f"{prefix}{line}\n"
-        await chat_scroll.mount(Static(user_text, classes="user-prompt"))
+        # Capture state before Claude runs; the replay reads SQLite on a worker
+        # thread while the prompt is mounted below
+        state_before_task = asyncio.create_task(asyncio.to_thread(self._get_dml_state))
+
+        # Add user message to chat with > prefix (continuation lines indented)
+        user_text = "> " + prompt.replace("\n", "\n  ") + "\n"
 
-        # Add inline loading indicator after user message
+        # Add inline loading indicator after user message; both widgets are
+        # mounted together so the chat lays out and repaints once
         loading_widget = Horizontal(
             LoadingIndicator(),
             Static(" Claude is thinking..."),
             classes="inline-loading",
             id="inline-loading"
         )
-        await chat_scroll.mount(loading_widget)
-        chat_scroll.scroll_end(animate=False)
+        with self.batch_update():
+            await chat_scroll.mount(Static(user_text, classes="user-prompt"), loading_widget)
+            chat_scroll.scroll_end(animate=False)
 
         # Note: context text karaoke already shows "Waiting for Claude..." as suffix
         # For no-context case, just show waiting
         if not context_text:
             narrator.update("[dim italic]Waiting for Claude...[/]")
 
-        # Capture state before Claude runs
-        state_before = self._get_dml_state()
+        # The snapshot must be complete before Claude can write any events
+        state_before = await state_before_task
+
+        # Stream Claude's output into a response widget that replaces the
+        # loading indicator on the first fragment
+        response_widget: Markdown | None = None
+        response_stream = None
+        streamed: list[str] = []
+
+        async def show_output(fragment: str) -> None:
+            nonlocal response_widget, response_stream
+            if response_widget is None:
+                response_widget = Markdown(classes="claude-response")
+                with self.batch_update():
+                    try:
+                        await loading_widget.remove()
+                    except Exception:
+                        pass
+                    await chat_scroll.mount(response_widget)
+                chat_scroll.anchor()
+                response_stream = Markdown.get_stream(response_widget)
+            streamed.append(fragment)
+            await response_stream.write(fragment)
 
         # Run Claude
-        response = await self.run_claude(prompt, continue_session=(self.current_prompt_index > 0))
+        try:
+            response = await self.run_claude(
+                prompt,
+                continue_session=(self.current_prompt_index > 0),
+                on_output=show_output,
+            )
+        finally:
+            if response_stream is not None:
+                await response_stream.stop()
+
+        # Capture state after Claude runs, overlapping the response mount below
+        state_after_task = asyncio.create_task(
+            asyncio.to_thread(self._get_dml_state, since=state_before)
+        )
+        # The turn's writes have landed; show them now instead of on the next poll
+        self.refresh_dml_state()
+
+        if response_widget is None:
+            # Nothing was streamed: swap the loading indicator for the response in one repaint
+            with self.batch_update():
+                try:
+                    await loading_widget.remove()
+                except Exception:
+                    pass
 
-        # Capture state after Claude runs
-        state_after = self._get_dml_state()
+                await chat_scroll.mount(Markdown(response, classes="claude-response"))
+                chat_scroll.scroll_end(animate=False)
+        else:
+            # Replace the streamed text if the run ended in a timeout or error message
+            if response != "".join(streamed).strip():
+                await response_widget.update(response)
+            chat_scroll.scroll_end(animate=False)
+
+        # Drop the oldest turns so layout cost stays flat on long scripts
+        excess = len(chat_scroll.children) - 2 * self.CHAT_HISTORY_TURNS
+        if excess > 0:
+            await chat_scroll.remove_children(chat_scroll.children[:excess])
 
         # Check expectations
+        state_after = await state_after_task
         expects = prompt_data.get("expects")
         expectation_warning = self._check_expectation(expects, state_before, state_after)
 
-        # Remove inline loading indicator
-        try:
-            loading_widget = self.query_one("#inline-loading")
-            await loading_widget.remove()
-        except Exception:
-            pass
-
-        # Add Claude response as markdown
-        await chat_scroll.mount(Markdown(response, classes="claude-response"))
-        chat_scroll.scroll_end(animate=False)
-
         # Update status
         self.current_prompt_index += 1
         is_complete = self.current_prompt_index >= len(self.prompts)
@@ -1392,7 +1644,7 @@ class DemoApp(App):
                 self._start_typewriter(final_narrator or "", suffix)
                 status_bar.update(
                     f"[{self.current_prompt_index}/{len(self.prompts)}] Auto-advancing... "
-                    "[dim](Q to quit)[/]"
+                    "[dim](ENTER/SPACE to skip the wait, Q to quit)[/]"
                 )
             else:
                 suffix = "[bold green]>>> Press ENTER/SPACE to continue <<<[/]"
@@ -1403,27 +1655,42 @@ class DemoApp(App):
 
         self.is_running = False
 
-        # Auto-advance after delay if enabled
+        # Auto-advance after delay if enabled. ENTER/SPACE starts the next
+        # prompt as a new exclusive worker, which cancels this wait.
         if self.auto_advance and not is_complete:
             await asyncio.sleep(5)
             self.run_next_prompt()
 
-    def _get_dml_state(self) -> dict | None:
-        """Get current DML state for comparison."""
+    def _get_dml_state(self, since: dict | None = None) -> dict | None:
+        """Get current DML state for comparison.
+
+        Pass the previous snapshot as ``since`` to count only decisions made after it.
+        """
         try:
-            store = EventStore(self.db_path)
-            engine = ReplayEngine(store)
-            state = engine.replay_to()
-            events = store.get_events()
-            store.close()
-            return {
-                "num_facts": len(state.facts),
-                "num_constraints": len([c for c in state.constraints.values() if c.active]),
-                "num_decisions": len(state.decisions),
-                "num_blocked": len([d for d in state.decisions if d.status == "blocked"]),
-                "last_seq": state.last_seq,
-            }
+            # Read the projection under the lock; the panel worker may be folding into it
+            with self._state_lock:
+                state = self._current_state()
+                decisions = state.decisions
+                if (
+                    since is not None
+                    and since["last_seq"] <= state.last_seq
+                    and since["num_decisions"] <= len(decisions)
+                ):
+                    # Decisions are append-only and keep their status
+                    num_blocked = since["num_blocked"] + sum(
+                        d.status == "blocked" for d in decisions[since["num_decisions"]:]
+                    )
+                else:
+                    num_blocked = sum(d.status == "blocked" for d in decisions)
+                return {
+                    "num_facts": len(state.facts),
+                    "num_constraints": sum(c.active for c in state.constraints.values()),
+                    "num_decisions": len(decisions),
+                    "num_blocked": num_blocked,
+                    "last_seq": state.last_seq,
+                }
         except Exception:
+            self._close_store()
             return None
 
     def _check_expectation(self, expects: str | None, before: dict | None, after: dict | None) -> str | None:
@@ -1452,8 +1719,16 @@ class DemoApp(App):
 
         return None
 
-    async def run_claude(self, prompt: str, continue_session: bool = False) -> str:
-        """Run claude -p command asynchronously in a temp directory."""
+    async def run_claude(
+        self,
+        prompt: str,
+        continue_session: bool = False,
+        on_output: Callable[[str], Awaitable[None]] | None = None,
+    ) -> str:
+        """Run claude -p command asynchronously in a temp directory.
+
+        ``on_output`` is awaited with each decoded stdout fragment as it arrives.
+        """
         # Prepend /dml to invoke the DML skill
         # Normalize whitespace (prompts from YAML may have internal newlines)
         clean_prompt = " ".join(prompt.split())
@@ -1466,10 +1741,9 @@ class DemoApp(App):
             cmd.append("-c")  # Continue most recent conversation in demo_dir
 
         # Debug logging
-        if self.debug_log:
+        if self._debug_fp:
             import shlex
-            with open(self.debug_log, "a") as f:
-                f.write(f"\n--- Command (cwd: {self.demo_dir}) ---\n{shlex.join(cmd)}\n")
+            self._debug_fp.write(f"\n--- Command (cwd: {self.demo_dir}) ---\n{shlex.join(cmd)}\n")
 
         # Pass DML_DB_PATH so Claude's MCP server uses same database
         env = os.environ.copy()
@@ -1483,136 +1757,278 @@ class DemoApp(App):
                 cwd=str(self.demo_dir),
                 env=env,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
-            response = stdout.decode().strip()
+            # Read stdout as it arrives (stderr drains alongside so neither pipe fills)
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            fragments: list[str] = []
+
+            async def read_stdout() -> None:
+                while chunk := await proc.stdout.read(4096):
+                    text = decoder.decode(chunk)
+                    if text:
+                        fragments.append(text)
+                        if on_output:
+                            await on_output(text)
+                fragments.append(decoder.decode(b"", final=True))
+
+            _, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(read_stdout(), proc.stderr.read(), proc.wait()),
+                timeout=120,
+            )
+            response = "".join(fragments).strip()
 
             # Debug logging
-            if self.debug_log:
-                with open(self.debug_log, "a") as f:
-                    f.write(f"\n--- Response ---\n{response}\n")
-                    if stderr:
-                        f.write(f"\n--- Stderr ---\n{stderr.decode()}\n")
+            if self._debug_fp:
+                record = f"\n--- Response ---\n{response}\n"
+                if stderr:
+                    record += f"\n--- Stderr ---\n{stderr.decode()}\n"
+                self._debug_fp.write(record)
 
             return response
         except asyncio.TimeoutError:
+            # Don't leave claude (and its MCP server) writing events behind the next turn.
+            # It may already have exited if the deadline hit while output was being shown.
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+            await proc.wait()
             return "[Timeout - Claude took too long to respond]"
         except FileNotFoundError:
             return "[Error: claude command not found]"
 
-    def refresh_dml_state(self) -> None:
-        """Refresh DML panels from database."""
+    def _set_dml_poll_interval(self, seconds: float) -> None:
+        """(Re)start the DML poll timer with the given period."""
+        if self._dml_poll_timer:
+            self._dml_poll_timer.stop()
+        self._dml_poll_interval = seconds
+        self._dml_poll_timer = self.set_interval(seconds, self._tick_dml_state)
+
+    def _wake_dml_poll(self) -> None:
+        """Return to the normal poll period after an idle back-off."""
+        if self._dml_poll_interval != self.DML_POLL_INTERVAL:
+            self._set_dml_poll_interval(self.DML_POLL_INTERVAL)
+        self._dml_idle_ticks = 0
+
+    def watch_is_running(self, running: bool) -> None:
+        """Poll at full rate while Claude may be writing events."""
+        if running:
+            self._wake_dml_poll()
+
+    def _tick_dml_state(self) -> None:
+        """Interval callback: poll for new events, backing off while idle."""
+        if self.refresh_dml_state():
+            self._wake_dml_poll()
+        elif not self.is_running:
+            self._dml_idle_ticks += 1
+            if (
+                self._dml_idle_ticks >= self.DML_IDLE_TICKS
+                and self._dml_poll_interval < self.DML_MAX_POLL_INTERVAL
+            ):
+                self._dml_idle_ticks = 0
+                self._set_dml_poll_interval(
+                    min(self._dml_poll_interval * 2, self.DML_MAX_POLL_INTERVAL)
+                )
+
+    def refresh_dml_state(self) -> bool:
+        """Refresh DML panels when the event log has grown.
+
+        Polls with a cheap MAX(global_seq) probe and debounces bursts of
+        appends into a single panel rebuild. Skipped entirely while an
+        overlay covers the panels; the first tick after it hides catches up.
+        Returns True if a rebuild was scheduled.
+        """
+        if self._panels_covered():
+            return False
+        if self._store is not None:
+            file_id = self._db_file_id()
+            if file_id != self._store_file_id:
+                # Reset outside the TUI (e.g. `dml reset`): drop the connection
+                # to the deleted file and re-render once the new one exists
+                self._close_store()
+                self._last_seen_seq = -1
+                if file_id is None:
+                    return False
         try:
-            store = EventStore(self.db_path)
-            engine = ReplayEngine(store)
-            state = engine.replay_to()
-            events = store.get_events()
-            store.close()
+            max_seq = self._get_store().get_max_seq()
+        except Exception:
+            self._close_store()
+            return False
+        if max_seq == self._last_seen_seq:
+            return False
+        self._last_seen_seq = max_seq
+
+        if self._dml_refresh_timer:
+            self._dml_refresh_timer.stop()
+        self._dml_refresh_timer = self.set_timer(0.1, self._refresh_dml_panels)
+        return True
+
+    def _panels_covered(self) -> bool:
+        """True while the intro or outro overlay hides the DML panels."""
+        return not self._intro_overlay.has_class("hidden") or self._outro_overlay.has_class("visible")
+
+    def _update_panel(self, widget: Static, text: str) -> None:
+        """Update a DML panel only if its markup changed since the last render."""
+        if self._panel_text.get(widget.id) != text:
+            self._panel_text[widget.id] = text
+            widget.update(text)
+
+    @classmethod
+    def _format_event_lines(cls, e) -> str:
+        """Events-panel markup for one event: a header line plus optional details."""
+        etype = e.type.value
+        color = cls._event_color(etype)
+        turn_info = f" [magenta]T{e.turn_id}[/]" if e.turn_id is not None else ""
+        seq_prefix = f"[dim]#{e.global_seq}[/]{turn_info}"
+
+        label = etype
+        label_field = _EVENT_LABEL_FIELD.get(e.type)
+        if label_field:
+            qualifier = e.payload.get(label_field, "")
+            if qualifier:
+                label = f"{etype} ({qualifier})"
+        header = f"{seq_prefix} [{color}]{label}[/]"
+
+        details = []
+        payload_summary = cls._payload_summary(e.payload)
+        if payload_summary:
+            details.append(payload_summary)
+        if e.caused_by is not None:
+            details.append(f"by #{e.caused_by}")
+        if e.correlation_id:
+            details.append(f"corr {str(e.correlation_id)[:8]}")
+        if details:
+            return f"{header}\n     [dim]{' | '.join(details)}[/]"
+        return header
+
+    def _refresh_dml_panels(self) -> None:
+        """Rebuild DML panels from the database (read on a worker thread)."""
+        self._dml_refresh_timer = None
+        self._load_dml_panels()
+
+    @work(exclusive=True, thread=True, group="dml")
+    def _load_dml_panels(self) -> None:
+        """Replay new events and build panel markup off the UI thread."""
+        worker = get_current_worker()
+        try:
+            event_count = self._get_store().count()
+            with self._state_lock:
+                texts = self._build_panel_texts(self._current_state())
         except Exception:
+            self.call_from_thread(self._dml_panels_failed)
             return
+        if not worker.is_cancelled:
+            self.call_from_thread(self._apply_dml_panels, texts, event_count)
+
+    def _dml_panels_failed(self) -> None:
+        """Drop the store after a failed read."""
+        self._close_store()
+        # Nothing was rendered; let the next poll retry even if no new events arrive
+        self._last_seen_seq = -1
+
+    def _build_panel_texts(self, state: ProjectionState) -> tuple[str, str, str, str]:
+        """Markup for the facts, constraints, decisions and events panels.
+
+        Call with _state_lock held (reads the event tail and line caches).
+        """
+        if self._state_panel_texts is None:
+            self._state_panel_texts = self._build_state_panel_texts(state)
+        return (*self._state_panel_texts, self._build_events_text())
 
-        # Update Facts - show key: value, with previous value if changed
-        facts_content = self.query_one("#facts-content", Static)
+    @staticmethod
+    def _build_state_panel_texts(state: ProjectionState) -> tuple[str, str, str]:
+        """Markup for the facts, constraints and decisions panels."""
+        # Facts - show key: value, with previous value if changed
         if state.facts:
             lines = []
-            for key, fact in list(state.facts.items())[:8]:
+            for key, fact in islice(state.facts.items(), 8):
                 lines.append(f"[bold cyan]{key}[/]")
                 if fact.previous_value is not None:
                     lines.append(f"  {fact.value} [dim](was: {fact.previous_value})[/]")
                 else:
                     lines.append(f"  {fact.value}")
-            facts_content.update("\n".join(lines))
+            facts_text = "\n".join(lines)
         else:
-            facts_content.update("[dim]No facts recorded yet[/]")
+            facts_text = "[dim]No facts recorded yet[/]"
 
-        # Update Constraints - show priority indicator and full text
-        constraints_content = self.query_one("#constraints-content", Static)
-        active = [c for c in state.constraints.values() if c.active]
+        # Constraints - show priority indicator and full text
+        # Stop scanning once the panel's five rows are filled
+        active = list(islice((c for c in state.constraints.values() if c.active), 5))
         if active:
             lines = []
-            for c in active[:5]:
+            for c in active:
                 if c.priority == "required":
                     lines.append(f"[red bold]● REQUIRED[/]")
                     lines.append(f"  {c.text}")
                 else:
                     lines.append(f"[yellow]○ preferred[/]")
                     lines.append(f"  {c.text}")
-            constraints_content.update("\n".join(lines))
+            constraints_text = "\n".join(lines)
         else:
-            constraints_content.update("[dim]No constraints active[/]")
+            constraints_text = "[dim]No constraints active[/]"
 
-        # Update Decisions - show status and text, newest first
-        decisions_content = self.query_one("#decisions-content", Static)
+        # Decisions - show status and text, newest first
         if state.decisions:
             lines = []
             # Show newest decisions first
-            for d in reversed(state.decisions[-5:]):
+            for d in islice(reversed(state.decisions), 5):
                 if d.status == "blocked":
                     lines.append(f"[red bold]✗ BLOCKED[/]")
                     lines.append(f"  [red]{d.text}[/]")
                 else:
                     lines.append(f"[green bold]✓ Committed[/]")
                     lines.append(f"  {d.text}")
-            decisions_content.update("\n".join(lines))
+            decisions_text = "\n".join(lines)
         else:
-            decisions_content.update("[dim]No decisions recorded[/]")
-
-        # Update Events panel - always show DML events
-        events_content = self.query_one("#events-content", Static)
-        events_panel = self.query_one("#events-panel", Vertical)
+            decisions_text = "[dim]No decisions recorded[/]"
 
-        # Flash indicator for new events
-        if len(events) > self._last_event_count:
-            events_panel.add_class("flash")
-            # Cancel previous timer to avoid race conditions
-            if self._flash_timer:
-                self._flash_timer.stop()
+        return facts_text, constraints_text, decisions_text
 
-            def clear_flash():
-                events_panel.remove_class("flash")
-                self._flash_timer = None
+    def _build_events_text(self) -> str:
+        """Markup for the events panel from the tail window."""
+        if self._event_tail:
+            # Show recent events, newest first (scrollable). Each event is
+            # formatted once; the cache keeps only what is still on screen.
+            cached = self._event_lines
+            self._event_lines = {}
+            lines = []
+            for e in reversed(self._event_tail):
+                text = cached.get(e.global_seq)
+                if text is None:
+                    text = self._format_event_lines(e)
+                self._event_lines[e.global_seq] = text
+                lines.append(text)
+            return "\n".join(lines)
+        return "[dim]No events yet[/]"
+
+    def _apply_dml_panels(self, texts: tuple[str, str, str, str], event_count: int) -> None:
+        """Show freshly built panel markup (UI thread)."""
+        facts_text, constraints_text, decisions_text, events_text = texts
+        # All four panels (and the flash) land in one repaint
+        with self.batch_update():
+            self._update_panel(self._facts_w, facts_text)
+            self._update_panel(self._constraints_w, constraints_text)
+            self._update_panel(self._decisions_w, decisions_text)
+
+            # Flash indicator for new events
+            events_panel = self._events_panel
+            if event_count > self._last_event_count:
+                events_panel.add_class("flash")
+                # Cancel previous timer to avoid race conditions
+                if self._flash_timer:
+                    self._flash_timer.stop()
 
-            self._flash_timer = self.set_timer(0.3, clear_flash)
-        self._last_event_count = len(events)
+                def clear_flash():
+                    events_panel.remove_class("flash")
+                    self._flash_timer = None
 
-        if events:
-            lines = []
-            # Show recent events, newest first (scrollable)
-            for e in reversed(events[-50:]):
-                seq = e.global_seq
-                etype = e.type.value
-                color = self._event_color(etype)
-                turn_info = f" [magenta]T{e.turn_id}[/]" if e.turn_id is not None else ""
-                seq_prefix = f"[dim]#{seq}[/]{turn_info}"
-
-                label = etype
-                if "Decision" in etype:
-                    status = e.payload.get("status", "")
-                    if status:
-                        label = f"{etype} ({status})"
-                elif "Constraint" in etype:
-                    priority = e.payload.get("priority", "")
-                    if priority:
-                        label = f"{etype} ({priority})"
-
-                lines.append(f"{seq_prefix} [{color}]{label}[/]")
-
-                details = []
-                payload_summary = self._payload_summary(e.payload)
-                if payload_summary:
-                    details.append(payload_summary)
-                if e.caused_by is not None:
-                    details.append(f"by #{e.caused_by}")
-                if e.correlation_id:
-                    details.append(f"corr {str(e.correlation_id)[:8]}")
-                if details:
-                    lines.append(f"     [dim]{' | '.join(details)}[/]")
-            events_content.update("\n".join(lines))
-        else:
-            events_content.update("[dim]No events yet[/]")
+                self._flash_timer = self.set_timer(0.3, clear_flash)
+            self._last_event_count = event_count
 
+            self._update_panel(self._events_w, events_text)
 
 def main(script_name: str | None = None, auto: bool = False, db_path: str | None = None, debug: bool = False, recording: bool = False):
     """Run the demo TUI."""
+    DemoApp.install_uvloop()
+
     # If already recording, just run the app
     if recording or os.environ.get("DML_RECORDING"):
         app = DemoApp(script_name=script_name, auto_advance=auto, db_path=db_path, debug=debug)
@@ -1629,10 +2045,11 @@ def main(script_name: str | None = None, auto: bool = False, db_path: str | None
     if isinstance(result, tuple) and result[0] == "record":
         output_file = result[1]
         print(f"\n🎬 Starting recording to: {output_file}")
-        print("Press Ctrl+D or type 'exit' when done to stop recording.\n")
+        print("Press Ctrl+D or type 'exit' when done to stop recording.")
+        print(f"Afterwards, upload with: asciinema upload {output_file}")
+        print(f"            or play with: asciinema play {output_file}\n", flush=True)
 
-        # Build command to relaunch inside asciinema
-        import sys
+        # Relaunch inside asciinema, replacing this process (nothing runs after it)
         cmd = [
             "asciinema", "rec",
             "--stdin",  # Record stdin for interactive feel
@@ -1641,14 +2058,9 @@ def main(script_name: str | None = None, auto: bool = False, db_path: str | None
         ]
 
         try:
-            subprocess.run(cmd, check=True)
-            print(f"\n✅ Recording saved to: {output_file}")
-            print(f"   Upload with: asciinema upload {output_file}")
-            print(f"   Play with:   asciinema play {output_file}")
-        except subprocess.CalledProcessError as e:
+            os.execvp(cmd[0], cmd)
+        except OSError as e:
             print(f"\n❌ Recording failed: {e}")
-        except KeyboardInterrupt:
-            print(f"\n⏹️  Recording stopped. File saved to: {output_file}")
 
     elif debug:
         print(f"\nDebug log written to: ~/.dml/demo-debug.log")
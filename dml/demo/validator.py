@@ -15,7 +15,7 @@ import tempfile
 import time
 from pathlib import Path
 
-from dml.demo.tui import load_demo_prompts
+from dml.demo.scripts import load_demo_prompts
 
 
 def get_db_state(db_path: str) -> dict:
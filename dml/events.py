@@ -3,6 +3,7 @@
 import json
 import sqlite3
 import threading
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -178,7 +179,7 @@ class EventStore:
                 "SELECT * FROM events WHERE global_seq >= ? AND global_seq <= ? ORDER BY global_seq",
                 (from_seq, to_seq),
             )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+        return [self._row_to_event(row) for row in cursor]
 
     def get_by_correlation(self, correlation_id: str) -> list[Event]:
         """Get all events with given correlation_id for provenance chain."""
@@ -187,7 +188,7 @@ class EventStore:
             "SELECT * FROM events WHERE correlation_id = ? ORDER BY global_seq",
             (correlation_id,),
         )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+        return [self._row_to_event(row) for row in cursor]
 
     def get_by_type(self, event_type: EventType) -> list[Event]:
         """Get all events of a specific type."""
@@ -196,7 +197,7 @@ class EventStore:
             "SELECT * FROM events WHERE type = ? ORDER BY global_seq",
             (event_type.value,),
         )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+        return [self._row_to_event(row) for row in cursor]
 
     def get_caused_by(self, seq: int) -> list[Event]:
         """Get all events caused by a specific event."""
@@ -205,7 +206,7 @@ class EventStore:
             "SELECT * FROM events WHERE caused_by = ? ORDER BY global_seq",
             (seq,),
         )
-        return [self._row_to_event(row) for row in cursor.fetchall()]
+        return [self._row_to_event(row) for row in cursor]
 
     def get_max_seq(self) -> int:
         """Get the maximum global_seq in the store."""
@@ -214,6 +215,12 @@ class EventStore:
         row = cursor.fetchone()
         return row[0] if row[0] is not None else 0
 
+    def count(self) -> int:
+        """Get the number of events without loading them."""
+        conn = self._get_conn()
+        cursor = conn.execute("SELECT COUNT(*) FROM events")
+        return cursor.fetchone()[0]
+
     def _row_to_event(self, row: sqlite3.Row) -> Event:
         """Convert database row to Event."""
         return Event(
@@ -231,3 +238,38 @@ class EventStore:
         if hasattr(self._local, "conn"):
             self._local.conn.close()
             del self._local.conn
+
+
+def reset_database(db_path: str | Path) -> list[str]:
+    """Delete the database (and its WAL/journal files) and create a fresh one.
+
+    Returns warnings for steps that failed but did not stop the reset.
+    """
+    db_path = Path(db_path)
+    warnings: list[str] = []
+
+    if db_path.exists():
+        # Checkpoint WAL to flush any pending writes before deleting
+        try:
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.close()
+        except sqlite3.Error as e:
+            warnings.append(f"WAL checkpoint failed: {e}")
+
+        # Small delay for any lingering connections to release
+        time.sleep(0.1)
+
+        for suffix in ["", "-wal", "-shm", "-journal"]:
+            p = Path(str(db_path) + suffix)
+            if p.exists():
+                try:
+                    p.unlink()
+                except OSError as e:
+                    warnings.append(f"Could not delete {p}: {e}")
+
+        # Small delay to ensure filesystem catches up
+        time.sleep(0.1)
+
+    EventStore(db_path).close()
+    return warnings
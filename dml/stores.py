@@ -75,6 +75,11 @@ class EventStoreBackend(ABC):
         """Get the maximum global_seq in the store."""
         ...
 
+    @abstractmethod
+    def count(self) -> int:
+        """Get the number of events in the store."""
+        ...
+
     @abstractmethod
     def close(self) -> None:
         """Close the backend and release resources."""
@@ -203,6 +208,14 @@ class RedisEventStore(EventStoreBackend):
         """
         raise NotImplementedError("RedisEventStore is a stub")
 
+    def count(self) -> int:
+        """Get event count using XLEN (stub).
+
+        Would use:
+            return self._client.xlen(self._stream_key)
+        """
+        raise NotImplementedError("RedisEventStore is a stub")
+
     def close(self) -> None:
         """Close Redis connection (stub)."""
         if self._client:
@@ -166,6 +166,9 @@ class TracedEventStore:
     def get_max_seq(self) -> int:
         return self._store.get_max_seq()
 
+    def count(self) -> int:
+        return self._store.count()
+
     def close(self) -> None:
         self._store.close()
 
@@ -0,0 +1,101 @@
+"""Tests for demo script loading and its JSON parse cache."""
+
+import json
+import os
+
+import pytest
+
+from dml.demo import scripts
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the prompts cache at a temp file instead of ~/.dml."""
+    path = tmp_path / "cache" / "prompts.cache.json"
+    monkeypatch.setattr(scripts, "_PROMPTS_CACHE", path)
+    monkeypatch.setattr(scripts, "_scripts_memo", None)
+    return path
+
+
+@pytest.fixture
+def prompts_file(tmp_path):
+    path = tmp_path / "prompts.yaml"
+    path.write_text("demo:\n  name: Demo\n  prompts:\n    - prompt: hello\n")
+    return path
+
+
+def key_for(path):
+    st = path.stat()
+    return [str(path), st.st_mtime_ns, st.st_size]
+
+
+class TestReadAllScripts:
+    def test_parses_yaml_and_writes_cache(self, cache_file, prompts_file):
+        key = key_for(prompts_file)
+        data = scripts._read_all_scripts(prompts_file, key)
+
+        assert data == {"demo": {"name": "Demo", "prompts": [{"prompt": "hello"}]}}
+        assert json.loads(cache_file.read_text()) == {"key": key, "scripts": data}
+        # The temp file was renamed into place
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+    def test_cache_hit_skips_yaml(self, cache_file, prompts_file):
+        key = key_for(prompts_file)
+        cache_file.parent.mkdir()
+        cache_file.write_text(json.dumps({"key": key, "scripts": {"cached": {}}}))
+
+        assert scripts._read_all_scripts(prompts_file, key) == {"cached": {}}
+
+    def test_stale_key_reparses(self, cache_file, prompts_file):
+        scripts._read_all_scripts(prompts_file, key_for(prompts_file))
+
+        prompts_file.write_text("other:\n  name: Other\n")
+        st = prompts_file.stat()
+        os.utime(prompts_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        new_key = key_for(prompts_file)
+
+        assert scripts._read_all_scripts(prompts_file, new_key) == {"other": {"name": "Other"}}
+        assert json.loads(cache_file.read_text())["key"] == new_key
+
+    def test_corrupt_cache_falls_back_to_yaml(self, cache_file, prompts_file):
+        cache_file.parent.mkdir()
+        cache_file.write_text("{not json")
+        key = key_for(prompts_file)
+
+        data = scripts._read_all_scripts(prompts_file, key)
+
+        assert data["demo"]["name"] == "Demo"
+        assert json.loads(cache_file.read_text())["key"] == key
+
+    @pytest.mark.parametrize("yaml_text", [
+        "demo:\n  when: 2024-01-01\n",  # date: not JSON serializable
+        "demo:\n  1: one\n",  # int key: comes back as "1"
+    ])
+    def test_data_that_does_not_round_trip_is_not_cached(self, cache_file, tmp_path, yaml_text):
+        path = tmp_path / "odd.yaml"
+        path.write_text(yaml_text)
+
+        data = scripts._read_all_scripts(path, key_for(path))
+
+        assert "demo" in data
+        assert not cache_file.exists()
+
+    def test_failed_write_leaves_no_temp_file(self, cache_file, prompts_file, monkeypatch):
+        def fail(*args):
+            raise OSError("read-only")
+
+        monkeypatch.setattr(scripts.os, "replace", fail)
+
+        assert scripts._read_all_scripts(prompts_file, key_for(prompts_file))["demo"]
+        assert list(cache_file.parent.iterdir()) == []
+
+
+class TestLoadAllScripts:
+    def test_repeat_loads_are_memoized(self, cache_file):
+        first = scripts.load_all_scripts()
+        assert scripts.load_all_scripts() is first
+        assert cache_file.exists()
+
+    def test_load_demo_prompts_unknown_name(self, cache_file):
+        with pytest.raises(KeyError, match="not found"):
+            scripts.load_demo_prompts("no-such-script")
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from dml.events import Event, EventStore, EventType
+from dml.events import Event, EventStore, EventType, reset_database
 
 
 @pytest.fixture
@@ -178,6 +178,12 @@ class TestEventStore:
         store.append(Event(type=EventType.TurnStarted, payload={}))
         assert store.get_max_seq() == 3
 
+    def test_count(self, store):
+        assert store.count() == 0
+        store.append(Event(type=EventType.TurnStarted, payload={}))
+        store.append(Event(type=EventType.FactAdded, payload={"key": "a", "value": 1}))
+        assert store.count() == 2
+
     def test_wal_mode_enabled(self, temp_db):
         store = EventStore(temp_db)
         conn = store._get_conn()
@@ -185,3 +191,23 @@ class TestEventStore:
         mode = cursor.fetchone()[0]
         assert mode.lower() == "wal"
         store.close()
+
+
+class TestResetDatabase:
+    def test_reset_clears_events(self, temp_db):
+        store = EventStore(temp_db)
+        store.append(Event(type=EventType.TurnStarted, payload={}))
+        store.append(Event(type=EventType.TurnStarted, payload={}))
+        store.close()
+
+        assert reset_database(temp_db) == []
+
+        store = EventStore(temp_db)
+        assert store.count() == 0
+        assert store.append(Event(type=EventType.TurnStarted, payload={})) == 1
+        store.close()
+
+    def test_reset_creates_missing_database(self, tmp_path):
+        db_path = tmp_path / "fresh.db"
+        assert reset_database(db_path) == []
+        assert db_path.exists()